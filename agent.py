@@ -1,16 +1,55 @@
 import os
+import asyncio
+import logging
+import functools
+import inspect
+import html
+from itertools import islice
+from urllib.parse import parse_qsl, urlparse
+import threading
+import weakref
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_toolbelt import MultipartEncoder
+from cachetools import TTLCache, cached
+from cachetools.func import ttl_cache
 from dotenv import load_dotenv
 from jira import JIRA
 from atlassian import Confluence
 from google.adk.agents import Agent
 from google.adk.tools.mcp_tool import McpToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StreamableHTTPServerParams
+from google.adk.dependencies._mcp import IS_MCP_SDK_V2
+
+# The MCP transport only works with the HTTP library its SDK major was built on
+# (httpx for MCP 1.x, httpx2 for 2.x); the Jira client below always uses httpx.
+if IS_MCP_SDK_V2:
+    import httpx2 as mcp_http
+else:
+    mcp_http = httpx
 
 # Load secrets from your .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # --- 1. SET UP GITHUB TOOLSET (Remote MCP) ---
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+
+def _github_http_client(headers=None, timeout=None, auth=None):
+    """HTTP/2 client for the MCP transport, so tool calls are multiplexed over one TLS connection."""
+    # Same defaults as the SDK's own factory: 30s, with a 5 minute read for held-open streams.
+    # Redirects stay off; the transport follows same-origin ones itself, so the PAT never leaves GitHub.
+    return mcp_http.AsyncClient(
+        http2=True,
+        headers=headers,
+        timeout=timeout if timeout is not None else mcp_http.Timeout(30.0, read=300.0),
+        auth=auth,
+        limits=mcp_http.Limits(max_keepalive_connections=20, max_connections=50)
+    )
+
 github_tools = McpToolset(
     connection_params=StreamableHTTPServerParams(
         url="https://api.githubcopilot.com/mcp/",
@@ -18,41 +57,295 @@ github_tools = McpToolset(
             "Authorization": f"Bearer {GITHUB_TOKEN}",
             "X-MCP-Toolsets": "repos,pull_requests",
             "X-MCP-Readonly": "false"
-        }
+        },
+        httpx_client_factory=_github_http_client
     )
 )
 
 # --- 2. SET UP CONNECTIONS (Stable Python Libraries) ---
 
+# Nothing here connects at import time: each client is built on first use, once per process.
+
+def _require_env(*names: str):
+    missing = [n for n in names if not os.getenv(n)]
+    if missing:
+        raise RuntimeError(f"Missing environment variables: {', '.join(missing)}")
+    return [os.getenv(n) for n in names]
+
+def _log_request_id(response, *args, **kwargs):
+    """Logs Atlassian's per-request ID and latency so slow calls can be traced server-side."""
+    logger.debug("%s %s -> %s in %.0f ms (X-AREQUESTID: %s)", response.request.method, response.url,
+                 response.status_code, response.elapsed.total_seconds() * 1000,
+                 response.headers.get("X-AREQUESTID"))
+
+# Retry policy shared by the requests and httpx clients. Idempotent methods retry on
+# 429/5xx with exponential backoff; a POST is only replayed when the server rejected it
+# up front and said when to come back (429/503 + Retry-After), so comments never double-post.
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+POST_RETRY_STATUSES = frozenset([429, 503])
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+
+def _should_retry(method: str, status_code: int, has_retry_after: bool):
+    if method.upper() == "POST":
+        return has_retry_after and status_code in POST_RETRY_STATUSES
+    return status_code in RETRY_STATUSES
+
+class _AtlassianRetry(Retry):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST":
+            return bool(self.total) and _should_retry(method, status_code, has_retry_after)
+        return super().is_retry(method, status_code, has_retry_after)
+
+# Shared HTTP pool - keeps TLS connections to Atlassian alive between tool calls
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=_AtlassianRetry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            # Hand back the last 429/5xx once retries run out, so the client raises its own
+            # error type (JIRAError, HTTPError) instead of requests' RetryError
+            raise_on_status=False
+        )
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.hooks["response"].append(_log_request_id)
+    return session
+
+# Upload pool - also kept alive, but without automatic retries: a streamed body
+# can't be rewound, so a retried upload would send an empty or truncated file
+@functools.lru_cache(maxsize=1)
+def get_upload_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=5, pool_maxsize=10, max_retries=0))
+    session.headers["Connection"] = "keep-alive"
+    session.hooks["response"].append(_log_request_id)
+    return session
+
 # Jira Connection
-jira_conn = JIRA(
-    server=os.getenv("JIRA_URL"),
-    basic_auth=(os.getenv("ATLASSIAN_EMAIL"), os.getenv("ATLASSIAN_TOKEN"))
-)
+@functools.lru_cache(maxsize=1)
+def get_jira():
+    server, email, token = _require_env("JIRA_URL", "ATLASSIAN_EMAIL", "ATLASSIAN_TOKEN")
+    # max_retries=0 turns off ResilientSession's own retries (which replay POSTs on any
+    # connection error), leaving the shared adapter's Retry as the only retry layer
+    jira = JIRA(server=server, basic_auth=(email, token), max_retries=0)
+    # JIRA builds its own ResilientSession (it carries the auth), so share the pool through its adapter
+    jira._session.mount("https://", get_http_session().get_adapter("https://"))
+    jira._session.headers["Connection"] = "keep-alive"
+    return jira
 
 # Confluence Connection
-confluence_conn = Confluence(
-    url=os.getenv("CONFLUENCE_URL"),
-    username=os.getenv("ATLASSIAN_EMAIL"),
-    password=os.getenv("ATLASSIAN_TOKEN"),
-    cloud=True
-)
+@functools.lru_cache(maxsize=1)
+def get_confluence():
+    url, email, token = _require_env("CONFLUENCE_URL", "ATLASSIAN_EMAIL", "ATLASSIAN_TOKEN")
+    return Confluence(
+        url=url,
+        username=email,
+        password=token,
+        cloud=True,
+        session=get_http_session()
+    )
+
+# Async Jira Client (httpx) - lets independent Jira reads run concurrently.
+# One client and one set of semaphores per event loop: connections (and HTTP/2 streams)
+# are reused across tool calls, and the in-flight caps hold for the whole process.
+JIRA_CONCURRENCY = 10
+JIRA_BULK_CONCURRENCY = 8  # stays under Jira's ~10 req/s budget during long batches
+
+_jira_async_state = weakref.WeakKeyDictionary()  # event loop -> (client, semaphore, bulk_semaphore)
+
+def _jira_async():
+    """Returns the running loop's shared Jira client and semaphores, building them on first use."""
+    loop = asyncio.get_running_loop()
+    state = _jira_async_state.get(loop)
+    if state is None:
+        server, email, token = _require_env("JIRA_URL", "ATLASSIAN_EMAIL", "ATLASSIAN_TOKEN")
+        client = httpx.AsyncClient(
+            base_url=server,
+            auth=(email, token),
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=JIRA_CONCURRENCY, max_connections=JIRA_CONCURRENCY)
+        )
+        state = (client, asyncio.Semaphore(JIRA_CONCURRENCY), asyncio.Semaphore(JIRA_BULK_CONCURRENCY))
+        _jira_async_state[loop] = state
+    return state
+
+async def _jira_request(method: str, path: str, **kwargs):
+    """Sends one Jira request, backing off on 429/5xx the same way the requests session does."""
+    client, semaphore, _ = _jira_async()
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            response = await client.request(method, path, **kwargs)
+        retry_after = response.headers.get("Retry-After")
+        if attempt == MAX_RETRIES or not _should_retry(method, response.status_code, bool(retry_after)):
+            break
+        # Sleep outside the semaphore so a throttled call doesn't hold a slot
+        delay = RETRY_BACKOFF * (2 ** attempt)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        await asyncio.sleep(delay)
+    response.raise_for_status()
+    return response.json()
+
+async def _jira_get(path: str, params: dict = None):
+    return await _jira_request("GET", path, params=params)
+
+async def _count_issues(jql: str):
+    """Returns only the match count for a JQL query; no issues are transferred."""
+    # Jira Cloud's enhanced search has no 'total', so counts come from the dedicated endpoint
+    data = await _jira_request("POST", "/rest/api/3/search/approximate-count", json={"jql": jql})
+    return data['count']
+
+ISSUE_DETAIL_FIELDS = "summary,status,assignee,description"
+
+async def _fetch_issues(keys: list[str], fields: str = ISSUE_DETAIL_FIELDS, return_exceptions: bool = False):
+    """Fetches several issues concurrently (only `fields`); fan-outs share the smaller bulk cap."""
+    _, _, bulk_semaphore = _jira_async()
+
+    async def fetch(key):
+        async with bulk_semaphore:
+            return await _jira_get(f"/rest/api/2/issue/{key}", {"fields": fields})
+
+    return await asyncio.gather(*[fetch(k) for k in keys], return_exceptions=return_exceptions)
+
+def _run_sync(tool, *args):
+    """Runs an async tool to completion from sync code, closing the loop's client afterwards."""
+    async def main():
+        try:
+            return await tool(*args)
+        finally:
+            state = _jira_async_state.pop(asyncio.get_running_loop(), None)
+            if state:
+                await state[0].aclose()
+    return asyncio.run(main())
+
+# Write Guard - the LLM sometimes repeats a write after a slow or failed-looking call;
+# an identical write within a minute is skipped and reported as a duplicate, not as a new success
+_recent_writes = TTLCache(maxsize=1024, ttl=60)
+
+def _idempotent(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if key in _recent_writes:
+            return (f"⚠️ Duplicate skipped: an identical {func.__name__} call already succeeded in the last "
+                    f"minute ({_recent_writes[key]}). Nothing was written again; confirm with the user if "
+                    "they really want it repeated, then retry after a minute.")
+        result = func(*args, **kwargs)
+        if result.startswith("✅"):
+            _recent_writes[key] = result
+        return result
+    return wrapper
+
+# Every dict-returning tool reports failures the same way: the bare error text under
+# 'error' and the failing tool's name under 'tool', so callers can branch on one shape
+def _tool_error(tool: str, error) -> dict:
+    return {"error": str(error), "tool": tool}
+
+# Read Cache - the LLM often re-asks for data it fetched a moment ago, so read-only
+# tools keep successful results for two minutes; write tools clear it
+_cache = TTLCache(maxsize=1024, ttl=120)
+
+def _cached_tool(func):
+    def cache_key(args, kwargs):
+        return (func.__name__, args, tuple(sorted(kwargs.items())))
+
+    def remember(key, result):
+        if not (isinstance(result, dict) and "error" in result):
+            _cache[key] = result
+        return result
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key = cache_key(args, kwargs)
+            if key in _cache:
+                return _cache[key]
+            return remember(key, await func(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = cache_key(args, kwargs)
+        if key in _cache:
+            return _cache[key]
+        return remember(key, func(*args, **kwargs))
+    return wrapper
 
 # --- 3. JIRA STABLE TOOLS ---
 
-def search_jira(jql_query: str):
+# JQL templates - values are bound through int() / _jql_quote() so input can't change the query shape
+JQL_SPRINT = "sprint = {}"
+# Status-category buckets for sprint health are fixed, so their literals are baked in rather than quoted per call
+JQL_SPRINT_DONE = 'sprint = {} AND statusCategory = "Done"'
+JQL_SPRINT_IN_PROGRESS = 'sprint = {} AND statusCategory = "In Progress"'
+JQL_BACKLOG = "project = {} AND sprint is EMPTY AND resolution is EMPTY"
+
+def _jql_quote(value: str):
+    """Quotes a value as a JQL string literal."""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _search(jql: str, fields: str = "summary,status"):
+    """Runs a JQL search that only returns the fields the tools actually read."""
+    return get_jira().search_issues(jql, fields=fields, maxResults=100, expand="")
+
+# Metadata (projects, transitions) rarely changes, so it is cached for 10 minutes
+@ttl_cache(maxsize=256, ttl=600)
+def _projects():
+    return get_jira().projects()
+
+@ttl_cache(maxsize=256, ttl=600)
+def _transitions(issue_key: str):
+    return get_jira().transitions(issue_key)
+
+# Sprint name -> ID index per board, built once and reused for 5 minutes
+_sprint_cache = TTLCache(maxsize=64, ttl=300)
+
+@cached(_sprint_cache, lock=threading.Lock())
+def _sprint_index(board_id: int):
+    """Maps lowercased names of the board's active and future sprints to their IDs."""
+    sprints = get_jira().sprints(board_id, maxResults=False, state="active,future")
+    return {s.name.lower(): s.id for s in sprints}
+
+def clear_jira_cache():
+    """Clears cached projects, transitions, sprints, Confluence spaces and recent read results. Use it if the data looks stale."""
+    for fetcher in (_projects, _transitions, _spaces):
+        fetcher.cache_clear()
+    _sprint_cache.clear()
+    _cache.clear()
+    return "✅ Metadata cache cleared."
+
+async def search_jira(jql_query: str) -> dict:
     """Search for Jira tickets using JQL. Example: assignee = 'user@email.com'"""
     try:
-        issues = jira_conn.search_issues(jql_query)
-        results = [f"{i.key}: {i.fields.summary} ({i.fields.status})" for i in issues]
-        return "\n".join(results) if results else "No tickets found."
+        # Jira Cloud only serves enhanced search (/search/jql); the legacy /search endpoint is gone
+        data = await _jira_get("/rest/api/3/search/jql", {"jql": jql_query, "fields": "summary,status", "maxResults": 100})
+        issues = [
+            {"key": i['key'], "summary": i['fields']['summary'], "status": i['fields']['status']['name']}
+            for i in data['issues']
+        ]
+        return {"issues": issues}
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("search_jira", e)
+
+def search_jira_sync(jql_query: str) -> dict:
+    """Blocking version of search_jira for callers outside an event loop (scripts, the REPL)."""
+    return _run_sync(search_jira, jql_query)
 
+@_idempotent
 def comment_on_ticket(issue_key: str, comment: str):
     """Adds a comment to a Jira ticket."""
     try:
-        jira_conn.add_comment(issue_key, comment)
+        get_jira().add_comment(issue_key, comment)
         return f"✅ Comment added to {issue_key}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
@@ -60,23 +353,26 @@ def comment_on_ticket(issue_key: str, comment: str):
 def update_ticket_status(issue_key: str, status_name: str):
     """Moves a ticket to a new status. Use 'get_transitions' first to see valid names."""
     try:
-        jira_conn.transition_issue(issue_key, transition=status_name)
+        get_jira().transition_issue(issue_key, transition=status_name)
+        _transitions.cache_clear()
+        _cache.clear()
         return f"✅ {issue_key} moved to {status_name}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
-def get_transitions(issue_key: str):
+def get_transitions(issue_key: str) -> dict:
     """Lists the available status changes (transitions) for a specific ticket."""
     try:
-        transitions = jira_conn.transitions(issue_key)
-        return "\n".join([f"ID: {t['id']} - Name: {t['name']}" for t in transitions])
+        transitions = _transitions(issue_key)
+        return {"transitions": [{"id": t['id'], "name": t['name']} for t in transitions]}
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("get_transitions", e)
 
+@_idempotent
 def create_issue(project: str, summary: str, description: str, issuetype: str = 'Story'):
     """Creates a new Jira issue. Default type is 'Story'."""
     try:
-        new_issue = jira_conn.create_issue(
+        new_issue = get_jira().create_issue(
             project=project,
             summary=summary,
             description=description,
@@ -86,82 +382,133 @@ def create_issue(project: str, summary: str, description: str, issuetype: str =
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
-def get_issue_details(issue_key: str):
+def _issue_details(issue: dict):
+    fields = issue['fields']
+    return {
+        "key": issue['key'],
+        "summary": fields['summary'],
+        "status": fields['status']['name'],
+        "assignee": (fields['assignee'] or {}).get('displayName'),
+        "description": fields['description']
+    }
+
+@_cached_tool
+async def get_issue_details(issue_key: str) -> dict:
     """Fetches full details of a specific issue including description, assignee, and priority."""
     try:
-        issue = jira_conn.issue(issue_key)
-        details = (
-            f"Key: {issue.key}\nSummary: {issue.fields.summary}\n"
-            f"Status: {issue.fields.status.name}\nAssignee: {issue.fields.assignee}\n"
-            f"Description: {issue.fields.description}"
-        )
-        return details
+        [issue] = await _fetch_issues([issue_key])
+        return _issue_details(issue)
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("get_issue_details", e)
+
+async def get_issue_details_bulk(issue_keys: list[str]) -> dict:
+    """
+    Fetches details for several issues at once. Prefer this over calling get_issue_details once per ticket.
+    issue_keys: The ticket IDs (e.g., ['PROJ-1', 'PROJ-2']).
+    Returns a mapping of ticket ID to its details (or the error for that ticket).
+    """
+    try:
+        issues = await _fetch_issues(issue_keys, return_exceptions=True)
+        return {
+            key: _tool_error("get_issue_details", issue) if isinstance(issue, Exception) else _issue_details(issue)
+            for key, issue in zip(issue_keys, issues)
+        }
+    except Exception as e:
+        return _tool_error("get_issue_details_bulk", e)
+
+def get_issue_details_sync(issue_key: str) -> dict:
+    """Blocking version of get_issue_details for callers outside an event loop (scripts, the REPL)."""
+    return _run_sync(get_issue_details, issue_key)
 
 def assign_issue(issue_key: str, account_id: str):
     """Assigns an issue to a specific user using their Account ID."""
     try:
-        jira_conn.assign_issue(issue_key, account_id)
+        get_jira().assign_issue(issue_key, account_id)
+        _cache.clear()
         return f"✅ {issue_key} assigned to {account_id}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
+@_idempotent
 def add_attachment(issue_key: str, file_path: str):
     """Attaches a file to a Jira ticket."""
     try:
+        server, email, token = _require_env("JIRA_URL", "ATLASSIAN_EMAIL", "ATLASSIAN_TOKEN")
         with open(file_path, 'rb') as f:
-            jira_conn.add_attachment(issue=issue_key, attachment=f)
+            # Stream the file from disk in small chunks instead of reading it all into memory
+            encoder = MultipartEncoder(fields={"file": (os.path.basename(file_path), f, "application/octet-stream")})
+            response = get_upload_session().post(
+                f"{server.rstrip('/')}/rest/api/2/issue/{issue_key}/attachments",
+                data=encoder,
+                headers={"Content-Type": encoder.content_type, "X-Atlassian-Token": "no-check"},
+                auth=(email, token)
+            )
+        response.raise_for_status()
         return f"✅ File attached to {issue_key}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
-def get_issue_comments(issue_key: str):
+COMMENT_PAGE_SIZE = 100
+
+async def get_issue_comments(issue_key: str) -> dict:
     """Retrieves all comments for a specific issue."""
     try:
-        issue = jira_conn.issue(issue_key)
-        comments = [f"{c.author.displayName}: {c.body}" for c in issue.fields.comment.comments]
-        return "\n---\n".join(comments) if comments else "No comments found."
+        comments = []
+        while True:
+            data = await _jira_get(f"/rest/api/2/issue/{issue_key}/comment",
+                                   {"startAt": len(comments), "maxResults": COMMENT_PAGE_SIZE})
+            comments += [{"author": c['author']['displayName'], "body": c['body']} for c in data['comments']]
+            # Jira may cap maxResults below what was asked, so page on 'total', not page size
+            if not data['comments'] or len(comments) >= data['total']:
+                break
+        return {"key": issue_key, "total": data['total'], "comments": comments}
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("get_issue_comments", e)
+
+def get_issue_comments_sync(issue_key: str) -> dict:
+    """Blocking version of get_issue_comments for callers outside an event loop (scripts, the REPL)."""
+    return _run_sync(get_issue_comments, issue_key)
 
+@_idempotent
 def log_work(issue_key: str, time_spent: str):
     """Logs work on an issue. Format: '2h', '30m', '1d'."""
     try:
-        jira_conn.add_worklog(issue_key, timeSpent=time_spent)
+        get_jira().add_worklog(issue_key, timeSpent=time_spent)
         return f"✅ Logged {time_spent} to {issue_key}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
-def list_projects():
+def list_projects() -> dict:
     """Returns a list of all accessible Jira projects."""
     try:
-        projects = jira_conn.projects()
-        return "\n".join([f"{p.key}: {p.name}" for p in projects])
+        projects = _projects()
+        return {"projects": [{"key": p.key, "name": p.name} for p in projects]}
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("list_projects", e)
 
-def get_sprint_issues(sprint_id: int):
+def get_sprint_issues(sprint_id: int) -> dict:
     """Lists all issues within a specific sprint ID."""
     try:
-        issues = jira_conn.search_issues(f'sprint = {sprint_id}')
-        return "\n".join([f"{i.key}: {i.fields.summary}" for i in issues])
+        issues = _search(JQL_SPRINT.format(int(sprint_id)))
+        return {"sprint_id": sprint_id, "issues": [{"key": i.key, "summary": i.fields.summary} for i in issues]}
     except Exception as e:
-        return f"Error: {str(e)}"
+        return _tool_error("get_sprint_issues", e)
 
 def update_issue_priority(issue_key: str, priority_name: str):
     """Updates the priority of an issue (e.g., 'Highest', 'High', 'Low')."""
     try:
-        issue = jira_conn.issue(issue_key)
+        issue = get_jira().issue(issue_key)
         issue.update(fields={'priority': {'name': priority_name}})
+        _cache.clear()
         return f"✅ Priority updated to {priority_name} for {issue_key}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
+@_idempotent
 def link_issues(inward_key: str, outward_key: str, link_type: str = "Relates"):
     """Links two issues together (e.g., 'Blocks', 'Relates', 'Duplicate')."""
     try:
-        jira_conn.create_issue_link(type=link_type, inwardIssue=inward_key, outwardIssue=outward_key)
+        get_jira().create_issue_link(type=link_type, inwardIssue=inward_key, outwardIssue=outward_key)
         return f"✅ Linked {inward_key} as {link_type} {outward_key}."
     except Exception as e:
         return f"❌ Error: {str(e)}"
@@ -176,7 +523,8 @@ def create_sprint(board_id: int, sprint_name: str, start_date: str = None, end_d
     """
     try:
         # Create the sprint
-        new_sprint = jira_conn.create_sprint(name=sprint_name, board_id=board_id, startDate=start_date, endDate=end_date)
+        new_sprint = get_jira().create_sprint(name=sprint_name, board_id=board_id, startDate=start_date, endDate=end_date)
+        _sprint_cache.clear()
         return f"✅ Sprint '{sprint_name}' created successfully! ID: {new_sprint.id}"
     except Exception as e:
         return f"❌ Error creating sprint: {str(e)}"
@@ -188,8 +536,9 @@ def update_issue_type(issue_key: str, new_type: str):
     new_type: The name of the new issue type (e.g., 'Story', 'Bug', 'Task', 'Epic').
     """
     try:
-        issue = jira_conn.issue(issue_key)
+        issue = get_jira().issue(issue_key)
         issue.update(fields={'issuetype': {'name': new_type}})
+        _cache.clear()
         return f"✅ {issue_key} has been successfully changed to a '{new_type}'."
     except Exception as e:
         return f"❌ Error: {str(e)}. (Note: Some type changes require a 'Move' operation if status workflows differ.)"
@@ -201,127 +550,189 @@ def add_issue_to_sprint(issue_key: str, sprint_id: int):
     sprint_id: The numerical ID of the sprint (e.g., 42).
     """
     try:
-        issue = jira_conn.issue(issue_key)
+        issue = get_jira().issue(issue_key)
         issue.update(fields={'sprint': sprint_id})
         return f"✅ {issue_key} has been added to sprint {sprint_id}."
     except Exception as e:
         return (f"❌ Error: {str(e)}. Hint: If 'sprint' field isn't recognized, "
                 "ensure the ticket is in a project that has a Scrum board.")
 
+SPRINT_MOVE_BATCH = 50  # Jira Agile API limit per "move issues to sprint" call
+
+def add_issues_to_sprint_by_name(issue_keys: list[str], board_id: int, sprint_name: str):
+    """
+    Finds a sprint by name on a specific board and adds all the tickets to it in bulk.
+    Prefer this over calling add_issue_to_sprint_by_name once per ticket.
+    issue_keys: The ticket IDs (e.g., ['PROJ-123', 'PROJ-124']).
+    board_id: The ID of the board where the sprint exists.
+    sprint_name: The name of an active or future sprint (case-insensitive).
+    """
+    if not issue_keys:
+        return "❌ Error: No issue keys given; pass at least one ticket ID."
+    moved = []
+    try:
+        # 1. Find the sprint that matches the name (cached per board)
+        sprint_id = _sprint_index(board_id).get(sprint_name.lower())
+        if not sprint_id:
+            return f"❌ Could not find a sprint named '{sprint_name}' on board {board_id}."
+        # 2. Add the issues to the found sprint ID, one request per 50 tickets
+        for start in range(0, len(issue_keys), SPRINT_MOVE_BATCH):
+            batch = issue_keys[start:start + SPRINT_MOVE_BATCH]
+            get_jira().add_issues_to_sprint(sprint_id, batch)
+            moved += batch
+        return f"✅ {', '.join(issue_keys)} successfully added to '{sprint_name}' (ID: {sprint_id})."
+    except Exception as e:
+        if not moved:
+            return f"❌ Error: {str(e)}"
+        # Earlier batches already landed; say which, so only the rest gets retried
+        return (f"❌ Error: {str(e)}. Already added to '{sprint_name}': {', '.join(moved)}. "
+                f"Not added: {', '.join(issue_keys[len(moved):])}.")
+
 def add_issue_to_sprint_by_name(issue_key: str, board_id: int, sprint_name: str):
     """
     Finds a sprint by name on a specific board and adds the ticket to it.
     issue_key: The ticket ID (e.g., 'PROJ-123').
     board_id: The ID of the board where the sprint exists.
-    sprint_name: The case-sensitive name of the sprint.
+    sprint_name: The name of an active or future sprint (case-insensitive).
     """
-    try:
-        # 1. Get all sprints for the board
-        sprints = jira_conn.sprints(board_id)
-        # 2. Find the sprint that matches the name
-        target_sprint = next((s for s in sprints if s.name.lower() == sprint_name.lower()), None)
-        if not target_sprint:
-            return f"❌ Could not find a sprint named '{sprint_name}' on board {board_id}."
-        # 3. Add the issue to the found sprint ID
-        jira_conn.add_issues_to_sprint(target_sprint.id, [issue_key])
-        return f"✅ {issue_key} successfully added to '{sprint_name}' (ID: {target_sprint.id})."
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    return add_issues_to_sprint_by_name([issue_key], board_id, sprint_name)
 
-def get_backlog_tickets(project_key: str):
+def get_backlog_tickets(project_key: str) -> dict:
     """
     Retrieves all tickets in the backlog for a specific project.
     Backlog tickets are issues not assigned to any sprint.
     """
     try:
         # JQL Explanation:
-        # project = 'KEY' -> Filter by project
+        # project = "KEY" -> Filter by project
         # sprint is EMPTY -> Not in an active or future sprint
         # resolution is EMPTY -> Not closed/done
-        jql_query = f"project = '{project_key}' AND sprint is EMPTY AND resolution is EMPTY"
-
-        issues = jira_conn.search_issues(jql_query)
-        results = [f"{i.key}: {i.fields.summary} [{i.fields.status}]" for i in issues]
-
-        if not results:
-            return f"No backlog tickets found for project {project_key}."
+        jql_query = JQL_BACKLOG.format(_jql_quote(project_key))
 
-        return f"Backlog for {project_key}:\n" + "\n".join(results)
+        issues = _search(jql_query)
+        backlog = [{"key": i.key, "summary": i.fields.summary, "status": i.fields.status.name} for i in issues]
+        return {"project": project_key, "issues": backlog}
     except Exception as e:
-        return f"❌ Error retrieving backlog: {str(e)}"
+        return _tool_error("get_backlog_tickets", e)
 
-def get_sprint_id_by_name(board_id: int, sprint_name: str):
-    """Finds the internal ID for a sprint based on its name."""
+def get_sprint_id_by_name(board_id: int, sprint_name: str) -> dict:
+    """Finds the internal ID for an active or future sprint based on its name."""
     try:
-        sprints = jira_conn.sprints(board_id)
-        for s in sprints:
-            if s.name.lower() == sprint_name.lower():
-                return s.id
-        return None
+        return {"sprint_id": _sprint_index(board_id).get(sprint_name.lower())}
     except Exception as e:
-        return f"Error finding sprint: {str(e)}"
+        return _tool_error("get_sprint_id_by_name", e)
 
-def check_sprint_health(board_id: int, sprint_name: str):
+async def check_sprint_health(board_id: int, sprint_name: str) -> dict:
     """
     Analyzes the health of a sprint by checking the status of all its issues.
     Calculates completion percentage and lists blockers.
     """
     try:
-        sprint_id = get_sprint_id_by_name(board_id, sprint_name)
+        sprints = await asyncio.to_thread(_sprint_index, board_id)
+        sprint_id = sprints.get(sprint_name.lower())
         if not sprint_id:
-            return f"❌ Sprint '{sprint_name}' not found on board {board_id}."
+            return _tool_error("check_sprint_health", f"Sprint '{sprint_name}' not found on board {board_id}.")
 
-        issues = jira_conn.search_issues(f'sprint = {sprint_id}')
-        if not issues:
-            return f"Sprint '{sprint_name}' is empty."
-
-        total = len(issues)
-        done = len([i for i in issues if i.fields.status.name.lower() in ['done', 'closed', 'resolved']])
-        in_progress = len([i for i in issues if i.fields.status.name.lower() in ['in progress', 'review']])
+        # Let Jira do the bucketing: three count-only queries instead of fetching every issue
+        total, done, in_progress = await asyncio.gather(
+            _count_issues(JQL_SPRINT.format(sprint_id)),
+            _count_issues(JQL_SPRINT_DONE.format(sprint_id)),
+            _count_issues(JQL_SPRINT_IN_PROGRESS.format(sprint_id))
+        )
         to_do = total - (done + in_progress)
 
         # Calculate Percentage
-        completion_rate = (done / total) * 100
-
-        health_report = (
-            f"📊 **Health Report for {sprint_name}**\n"
-            f"- Completion: {completion_rate:.1f}%\n"
-            f"- ✅ Done: {done}\n"
-            f"- 🚧 In Progress: {in_progress}\n"
-            f"- 📝 To Do: {to_do}\n"
-            f"- 🚩 Total Issues: {total}"
-        )
-        return health_report
+        completion_rate = (done / total) * 100 if total else 0.0
+
+        return {
+            "sprint": sprint_name,
+            "sprint_id": sprint_id,
+            "completion_pct": round(completion_rate, 1),
+            "done": done,
+            "in_progress": in_progress,
+            "to_do": to_do,
+            "total": total
+        }
     except Exception as e:
-        return f"❌ Error calculating health: {str(e)}"
+        return _tool_error("check_sprint_health", e)
+
+def check_sprint_health_sync(board_id: int, sprint_name: str) -> dict:
+    """Blocking version of check_sprint_health for callers outside an event loop (scripts, the REPL)."""
+    return _run_sync(check_sprint_health, board_id, sprint_name)
 
 # --- 4. CONFLUENCE STABLE TOOLS ---
 
-def read_confluence_page(page_id: str):
-    """Reads the content of a Confluence page by ID."""
-    try:
-        page = confluence_conn.get_page_by_id(page_id, expand='body.storage')
-        return page['body']['storage']['value']
-    except Exception as e:
-        return f"Error: {str(e)}"
+CONFLUENCE_PAGE_SIZE = 50
 
-def search_confluence(query: str):
-    """Searches Confluence pages using CQL siteSearch."""
+def _follow_next(path: str, params: dict):
+    """
+    Yields results from a v1 REST listing, requesting the next page only when it is consumed.
+    Each next request reuses the query of `_links.next`, so offset-paged listings and
+    cursor-paged searches are walked the same way, and a capped 'limit' can't end it early.
+    """
+    while True:
+        data = get_confluence().get(path, params=params)
+        yield from data.get('results', [])
+        next_link = data.get('_links', {}).get('next')
+        if not next_link:
+            return
+        params = dict(parse_qsl(urlparse(next_link).query))
+
+def _cql_search(cql: str, page_size: int = 25, **params):
+    """Yields CQL search results, following the cursor in `_links.next` instead of re-scanning offsets."""
+    return _follow_next("rest/api/search", {"cql": cql, "limit": page_size, **params})
+
+@ttl_cache(maxsize=256, ttl=600)
+def _spaces(max_items: int):
+    spaces = _follow_next("rest/api/space", {"limit": CONFLUENCE_PAGE_SIZE})
+    return list(islice(spaces, max_items))
+
+# page_id -> (ETag, result); a re-read sends If-None-Match and an unchanged page comes back as an empty 304
+_page_etags = TTLCache(maxsize=256, ttl=3600)
+
+def read_confluence_page(page_id: str) -> dict:
+    """Reads the content of a Confluence page by ID."""
     try:
-        search_results = confluence_conn.cql(cql=f'siteSearch ~ "{query}"', limit=5)
-        results = search_results.get('results', [])
-        if not results:
-            return f"No pages found matching '{query}'."
+        confluence = get_confluence()
+        headers = dict(confluence.default_headers)
+        known = _page_etags.get(page_id)
+        if known:
+            headers["If-None-Match"] = known[0]
+        response = confluence.get(f"rest/api/content/{page_id}", params={"expand": "body.storage"},
+                                  headers=headers, advanced_mode=True)
+        if known and response.status_code == 304:
+            return known[1]
+        response.raise_for_status()
+        page = response.json()
+        result = {"id": page['id'], "title": page['title'], "body": page['body']['storage']['value']}
+        if response.headers.get("ETag"):
+            _page_etags[page_id] = (response.headers["ETag"], result)
+        return result
+    except Exception as e:
+        return _tool_error("read_confluence_page", e)
+
+def search_confluence(query: str, max_results: int = 5) -> dict:
+    """Searches Confluence pages by their text using CQL. Raise max_results to see more matches."""
+    try:
+        escaped = query.replace('\\', '\\\\').replace('"', '\\"')
+        search_results = _cql_search(
+            f'type = page AND text ~ "{escaped}"',
+            page_size=min(max_results, 25),
+            expand="content.version",
+            includeArchivedSpaces="false"
+        )
+        results = islice(search_results, max_results)
         # One-liner to extract IDs and Titles
-        pages = [f"ID: {r['content']['id']} | Title: {r['content']['title']}" for r in results]
-        return "\n".join(pages)
+        return {"pages": [{"id": r['content']['id'], "title": r['content']['title']} for r in results]}
     except Exception as e:
-        return f"❌ Search error: {str(e)}"
+        return _tool_error("search_confluence", e)
 
+@_idempotent
 def create_confluence_page(space: str, title: str, body: str):
     """Creates a new page in a specific Confluence Space."""
     try:
-        confluence_conn.create_page(space, title, body)
+        get_confluence().create_page(space, title, body)
+        _cache.clear()
         return f"✅ Page '{title}' created in space {space}."
     except Exception as e:
         return f"Error: {str(e)}"
@@ -333,63 +744,73 @@ def create_confluence_space(space_key: str, space_name: str):
     """
     try:
         # space_key must be unique and usually all uppercase
-        confluence_conn.create_space(space_key.upper(), space_name)
+        get_confluence().create_space(space_key.upper(), space_name)
+        _spaces.cache_clear()
         return f"✅ Space '{space_name}' ({space_key.upper()}) created successfully!"
     except Exception as e:
         return f"❌ Error creating space: {str(e)}"
-def list_all_confluence_spaces():
-    """Retrieves a list of all accessible spaces in the Confluence account."""
+def list_all_confluence_spaces(max_items: int = 200) -> dict:
+    """Retrieves a list of all accessible spaces in the Confluence account. An empty list can mean missing permissions."""
     try:
-        # get_all_spaces returns a list of space objects
-        spaces = confluence_conn.get_all_spaces(start=0, limit=50)
-        results = spaces.get('results', [])
-
-        if not results:
-            return "No spaces found or you do not have permission to view them."
+        # The space listing is paged; only as many pages as max_items needs are fetched
+        spaces = _spaces(max_items)
+        return {"spaces": [{"key": s['key'], "name": s['name']} for s in spaces]}
+    except Exception as e:
+        return _tool_error("list_all_confluence_spaces", e)
 
-        space_list = [f"Key: {s['key']} | Name: {s['name']}" for s in results]
-        return "Available Spaces:\n" + "\n".join(space_list)
+def add_labels_to_page(page_id: str, labels: list[str]):
+    """
+    Adds several labels (tags) to a Confluence page in a single request.
+    labels: The label names (e.g., ['release-1.2', 'approved']).
+    """
+    # An empty list would go out as a POST with no body (the client drops falsy data)
+    if not labels:
+        return "❌ Error: No labels given; pass at least one label name."
+    try:
+        get_confluence().post(f"rest/api/content/{page_id}/label",
+                              data=[{"prefix": "global", "name": l} for l in labels])
+        _cache.clear()
+        return f"✅ Labels {', '.join(labels)} added to page {page_id}."
     except Exception as e:
-        return f"❌ Error listing spaces: {str(e)}"
+        return f"❌ Error adding labels: {str(e)}"
 
 def add_label_to_page(page_id: str, label: str):
     """Adds a specific label (tag) to a Confluence page for organization."""
-    try:
-        confluence_conn.set_page_label(page_id, label)
-        return f"✅ Label '{label}' added to page {page_id}."
-    except Exception as e:
-        return f"❌ Error adding label: {str(e)}"
+    return add_labels_to_page(page_id, [label])
 
-def get_page_labels(page_id: str):
+@_cached_tool
+def get_page_labels(page_id: str) -> dict:
     """Retrieves all labels currently attached to a page."""
     try:
-        labels_data = confluence_conn.get_page_labels(page_id)
-        labels = [l['name'] for l in labels_data.get('results', [])]
-        return f"Labels for {page_id}: " + (", ".join(labels) if labels else "None")
+        labels_data = get_confluence().get_page_labels(page_id)
+        return {"page_id": page_id, "labels": [l['name'] for l in labels_data.get('results', [])]}
     except Exception as e:
-        return f"❌ Error getting labels: {str(e)}"
+        return _tool_error("get_page_labels", e)
 
+@_idempotent
 def add_comment_to_page(page_id: str, text: str):
     """Adds a comment to a Confluence page."""
     try:
-        confluence_conn.attach_content(page_id, text)
+        get_confluence().attach_content(page_id, text)
+        _cache.clear()
         return f"✅ Comment added to page {page_id}."
     except Exception as e:
         return f"❌ Error adding comment: {str(e)}"
 
-def list_page_attachments(page_id: str):
+@_cached_tool
+def list_page_attachments(page_id: str) -> dict:
     """Lists all files attached to a specific page."""
     try:
-        attachments = confluence_conn.get_attachments_from_content(page_id)
-        files = [f['title'] for f in attachments.get('results', [])]
-        return "Attachments: " + (", ".join(files) if files else "None")
+        attachments = get_confluence().get_attachments_from_content(page_id)
+        return {"page_id": page_id, "attachments": [f['title'] for f in attachments.get('results', [])]}
     except Exception as e:
-        return f"❌ Error listing attachments: {str(e)}"
+        return _tool_error("list_page_attachments", e)
 
 def delete_confluence_page(page_id: str):
     """Deletes a page (moves it to trash)."""
     try:
-        confluence_conn.remove_page(page_id)
+        get_confluence().remove_page(page_id)
+        _cache.clear()
         return f"✅ Page {page_id} moved to trash."
     except Exception as e:
         return f"❌ Error deleting page: {str(e)}"
@@ -397,50 +818,133 @@ def delete_confluence_page(page_id: str):
 def update_page_content(page_id: str, title: str, body: str):
     """Updates the title and content of an existing page."""
     try:
-        confluence_conn.update_page(page_id, title, body)
+        get_confluence().update_page(page_id, title, body)
+        _cache.clear()
         return f"✅ Page {page_id} updated successfully."
     except Exception as e:
         return f"❌ Error updating page: {str(e)}"
 
-def get_all_pages_in_space(space_key: str):
-    """Lists the titles and IDs of all pages within a space."""
+@_cached_tool
+def get_all_pages_in_space(space_key: str, max_items: int = 200) -> dict:
+    """Lists the titles and IDs of all pages within a space (up to max_items)."""
     try:
-        pages = confluence_conn.get_all_pages_from_space(space_key, start=0, limit=50)
-        page_list = [f"ID: {p['id']} | Title: {p['title']}" for p in pages]
-        return f"Pages in {space_key}:\n" + "\n".join(page_list)
+        pages = _follow_next("rest/api/content", {"spaceKey": space_key, "type": "page", "limit": CONFLUENCE_PAGE_SIZE})
+        return {"space": space_key, "pages": [{"id": p['id'], "title": p['title']} for p in islice(pages, max_items)]}
     except Exception as e:
-        return f"❌ Error: {str(e)}"
+        return _tool_error("get_all_pages_in_space", e)
 
-def move_confluence_page(page_id: str, target_parent_id: str):
-    """Moves a page to a new parent page."""
+def _move_page(page_id: str, target_parent_id: str, title: str = None):
+    # update_page needs the current title; only look it up if the caller didn't supply it
+    if title is None:
+        title = get_confluence().get_page_by_id(page_id)['title']
+    get_confluence().update_page(page_id, title, body=None, parent_id=target_parent_id)
+
+def move_confluence_page(page_id: str, target_parent_id: str, title: str = None):
+    """
+    Moves a page to a new parent page.
+    title: Optional. The page's current title; pass it if you already know it to skip a lookup.
+    """
     try:
-        # This requires the target space and new parent ID
-        page_details = confluence_conn.get_page_by_id(page_id)
-        space = page_details['space']['key']
-        title = page_details['title']
-        confluence_conn.update_page(page_id, title, body=None, parent_id=target_parent_id)
+        _move_page(page_id, target_parent_id, title)
+        _cache.clear()
         return f"✅ Page {page_id} moved under parent {target_parent_id}."
     except Exception as e:
         return f"❌ Error moving page: {str(e)}"
 
-def search_by_label(label: str):
+CONFLUENCE_CONCURRENCY = 10
+
+async def move_pages(moves: dict[str, str]):
+    """
+    Moves several pages at once. Prefer this over calling move_confluence_page repeatedly.
+    moves: Mapping of page ID to its new parent page ID (e.g., {'1234': '5678'}).
+    """
+    if not moves:
+        return "❌ Error: No pages given; pass at least one page ID and its new parent."
+    try:
+        # One CQL search fetches every title that update_page needs. Non-numeric IDs can't
+        # exist, so they are left out of the query and reported as not found below.
+        titles = {}
+        ids = ",".join(str(page_id) for page_id in moves if str(page_id).isdigit())
+        if ids:
+            # CQL search is cursor-paged, so walk `_links.next` rather than offsets
+            found = _follow_next("rest/api/content/search", {"cql": f"id in ({ids})", "limit": CONFLUENCE_PAGE_SIZE})
+            titles = {p['id']: p['title'] for p in found}
+
+        semaphore = asyncio.Semaphore(CONFLUENCE_CONCURRENCY)
+
+        async def move(page_id, parent_id):
+            if str(page_id) not in titles:
+                return f"❌ Page {page_id} not found."
+            try:
+                async with semaphore:
+                    await asyncio.to_thread(_move_page, page_id, parent_id, titles[str(page_id)])
+                return f"✅ Page {page_id} moved under parent {parent_id}."
+            except Exception as e:
+                return f"❌ Error moving page {page_id}: {str(e)}"
+
+        results = await asyncio.gather(*[move(page_id, parent_id) for page_id, parent_id in moves.items()])
+        # TTLCache isn't thread-safe, so clear it once here rather than from each worker thread
+        _cache.clear()
+        return "\n".join(results)
+    except Exception as e:
+        return f"❌ Error moving pages: {str(e)}"
+
+def search_by_label(label: str) -> dict:
     """Finds all pages that share a specific label."""
     try:
-        results = confluence_conn.get_all_pages_by_label(label)
-        pages = [f"ID: {p['id']} | Title: {p['title']}" for p in results]
-        return f"Pages with label '{label}':\n" + "\n".join(pages)
+        results = get_confluence().get_all_pages_by_label(label)
+        return {"label": label, "pages": [{"id": p['id'], "title": p['title']} for p in results]}
     except Exception as e:
-        return f"❌ Error searching label: {str(e)}"
+        return _tool_error("search_by_label", e)
 
-def get_confluence_user_details(username_or_email: str):
+def get_confluence_user_details(username_or_email: str) -> dict:
     """Gets details about a Confluence user (useful for mentions/permissions)."""
     try:
-        user = confluence_conn.get_user_details_by_username(username_or_email)
-        return f"User: {user.get('displayName')} | AccountID: {user.get('accountId')}"
+        user = get_confluence().get_user_details_by_username(username_or_email)
+        return {"display_name": user.get('displayName'), "account_id": user.get('accountId')}
+    except Exception as e:
+        return _tool_error("get_confluence_user_details", e)
+
+# --- 5. CROSS-SYSTEM TOOLS ---
+
+async def _ensure_space_async(space_key: str):
+    """Raises if the Confluence space doesn't exist or isn't visible to us."""
+    await asyncio.to_thread(get_confluence().get_space, space_key)
+
+async def _create_confluence_page_async(space: str, title: str, body: str):
+    await asyncio.to_thread(get_confluence().create_page, space, title, body)
+    _cache.clear()
+
+async def courier_jira_to_confluence(issue_key: str, space_key: str, title: str):
+    """
+    Copies a Jira ticket's details into a new Confluence page in one step.
+    issue_key: The ticket ID (e.g., 'PROJ-123').
+    space_key: The Confluence space to create the page in (e.g., 'PROJ').
+    title: The title of the new page.
+    """
+    try:
+        # The Jira fetch and the Confluence space check don't depend on each other, so run them
+        # together (gather rather than TaskGroup, which would need Python 3.11)
+        results = await asyncio.gather(get_issue_details(issue_key), _ensure_space_async(space_key),
+                                       return_exceptions=True)
+        errors = [str(r) for r in results if isinstance(r, Exception)]
+        if errors:
+            return f"❌ Error: {'; '.join(errors)}"
+        issue = results[0]
+        if "error" in issue:
+            return f"❌ Error reading {issue_key}: {issue['error']}"
+
+        body = "".join(
+            f"<p><strong>{html.escape(label)}:</strong> {html.escape(str(issue[field]))}</p>"
+            for label, field in [("Key", "key"), ("Summary", "summary"), ("Status", "status"),
+                                 ("Assignee", "assignee"), ("Description", "description")]
+        )
+        await _create_confluence_page_async(space_key, title, body)
+        return f"✅ Page '{title}' created in space {space_key} from {issue_key}."
     except Exception as e:
-        return f"❌ User not found: {str(e)}"
+        return f"❌ Error: {str(e)}"
 
-# --- 5. THE SUB-AGENTS ---
+# --- 6. THE SUB-AGENTS ---
 
 github_agent = Agent(
     model="gemini-2.0-flash",
@@ -459,15 +963,16 @@ jira_agent = Agent(
     description="Specialist in Jira. Can search, comment, and move tickets.",
     instruction=(
         "You are a Jira expert. Use JQL for searching. "
-        "Before moving a ticket, check available transitions if you aren't sure of the name."
+        "Before moving a ticket, check available transitions if you aren't sure of the name. "
+        "When you need details for more than one ticket, call 'get_issue_details_bulk' once with all the keys."
     ),
     tools=[
         search_jira, comment_on_ticket, update_ticket_status, get_transitions,
-        create_issue, get_issue_details, assign_issue, add_attachment,
+        create_issue, get_issue_details, get_issue_details_bulk, assign_issue, add_attachment,
         get_issue_comments, log_work, list_projects, get_sprint_issues,
         update_issue_priority, link_issues, create_sprint, update_issue_type,
-        add_issue_to_sprint, add_issue_to_sprint_by_name, get_backlog_tickets,
-        get_sprint_id_by_name,check_sprint_health
+        add_issue_to_sprint, add_issue_to_sprint_by_name, add_issues_to_sprint_by_name, get_backlog_tickets,
+        get_sprint_id_by_name, check_sprint_health, clear_jira_cache
     ]
 )
 
@@ -484,13 +989,13 @@ confluence_agent = Agent(
     ),
     tools=[read_confluence_page, search_confluence, create_confluence_page,
            create_confluence_space, list_all_confluence_spaces,
-           add_label_to_page, get_page_labels, add_comment_to_page,
+           add_label_to_page, add_labels_to_page, get_page_labels, add_comment_to_page,
            list_page_attachments, delete_confluence_page, update_page_content,
-           get_all_pages_in_space, move_confluence_page, search_by_label,
+           get_all_pages_in_space, move_confluence_page, move_pages, search_by_label,
            get_confluence_user_details]
 )
 
-# --- 6. THE MASTER AGENT ---
+# --- 7. THE MASTER AGENT ---
 
 root_agent = Agent(
     model="gemini-2.0-flash",
@@ -504,8 +1009,11 @@ root_agent = Agent(
         "   and provide that specific data in your request to them. "
         "4. DO NOT ask the user to provide data that another agent has already retrieved. "
         "Example: If Jira_Expert gives you ticket details, tell Confluence_Expert: "
-        "'Create a page with this content: [Paste details here]'"
+        "'Create a page with this content: [Paste details here]' "
+        "Shortcut: to copy a single Jira ticket into a new Confluence page, call 'courier_jira_to_confluence' "
+        "yourself instead of going through both experts."
     ),
+    tools=[courier_jira_to_confluence],
     sub_agents=[github_agent, jira_agent, confluence_agent]
 )
 
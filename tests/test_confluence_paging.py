@@ -0,0 +1,91 @@
+from urllib.parse import urlencode
+
+import pytest
+
+import agent
+
+
+class FakeConfluence:
+    """Serves v1 listings the way Cloud does: 'limit' capped at 3 and the next page only in `_links.next`."""
+
+    def __init__(self, spaces, pages):
+        self.listings = {"rest/api/space": spaces, "rest/api/content": pages}
+        self.requests = []
+        self.moved = {}
+
+    def get(self, path, params=None):
+        self.requests.append((path, dict(params)))
+        if path == "rest/api/content/search":
+            return self.search(params)
+        items = self.listings[path]
+        start, limit = int(params.get("start", 0)), min(int(params["limit"]), 3)
+        data = {"results": items[start:start + limit], "_links": {}}
+        if start + limit < len(items):
+            data["_links"]["next"] = f"/{path}?{urlencode({**params, 'start': start + limit, 'limit': limit})}"
+        return data
+
+    def search(self, params):
+        # CQL search ignores 'start' and pages only by cursor
+        ids = params["cql"].removeprefix("id in (").removesuffix(")").split(",")
+        pages = {p["id"]: p for p in self.listings["rest/api/content"]}
+        offset = int(params.get("cursor", 0))
+        batch = [pages[i] for i in ids if i in pages][offset:offset + 3]
+        data = {"results": batch, "_links": {}}
+        if offset + 3 < len([i for i in ids if i in pages]):
+            data["_links"]["next"] = f"/rest/api/content/search?{urlencode({**params, 'cursor': offset + 3})}"
+        return data
+
+    def update_page(self, page_id, title, body=None, parent_id=None):
+        self.moved[page_id] = (title, parent_id)
+
+    # atlassian-python-api 5.x hands these back as auto-paging generators; the tools must not rely on them
+    def get_all_spaces(self, *args, **kwargs):
+        yield from self.listings["rest/api/space"]
+
+    def get_all_pages_from_space(self, *args, **kwargs):
+        yield from self.listings["rest/api/content"]
+
+
+@pytest.fixture
+def confluence(monkeypatch):
+    fake = FakeConfluence(
+        spaces=[{"key": f"S{i}", "name": f"Space {i}"} for i in range(7)],
+        pages=[{"id": str(i), "title": f"Page {i}"} for i in range(8)],
+    )
+    monkeypatch.setattr(agent, "get_confluence", lambda: fake)
+    agent._spaces.cache_clear()
+    agent._cache.clear()
+    return fake
+
+
+def test_get_all_pages_in_space_follows_next_links(confluence):
+    result = agent.get_all_pages_in_space("SP")
+    assert result == {"space": "SP", "pages": [{"id": str(i), "title": f"Page {i}"} for i in range(8)]}
+    assert confluence.requests[0] == ("rest/api/content", {"spaceKey": "SP", "type": "page", "limit": 50})
+    assert len(confluence.requests) == 3
+
+
+def test_get_all_pages_in_space_stops_at_max_items(confluence):
+    result = agent.get_all_pages_in_space("SP", max_items=4)
+    assert [p["id"] for p in result["pages"]] == ["0", "1", "2", "3"]
+    assert len(confluence.requests) == 2
+
+
+def test_list_all_confluence_spaces_follows_next_links(confluence):
+    result = agent.list_all_confluence_spaces()
+    assert [s["key"] for s in result["spaces"]] == [f"S{i}" for i in range(7)]
+    assert all(path == "rest/api/space" for path, _ in confluence.requests)
+
+
+def test_move_pages_follows_search_cursor(confluence):
+    moves = {str(i): "99" for i in range(7)} | {"abc": "99", "42": "99"}
+    result = agent.asyncio.run(agent.move_pages(moves))
+    assert confluence.moved == {str(i): (f"Page {i}", "99") for i in range(7)}
+    assert result.count("✅") == 7
+    assert "❌ Page abc not found." in result and "❌ Page 42 not found." in result
+    assert "abc" not in confluence.requests[0][1]["cql"]
+
+
+def test_move_pages_rejects_empty_mapping(confluence):
+    assert agent.asyncio.run(agent.move_pages({})).startswith("❌")
+    assert confluence.requests == []